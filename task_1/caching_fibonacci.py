@@ -1,31 +1,68 @@
-from typing import Callable
+from functools import cache
+from typing import Callable, Tuple
+
+# Largest n for which F(n) still fits into a signed 64-bit integer
+_SMALL_FIB_LIMIT = 92
+
+
+def _build_small_fib_table(limit: int) -> Tuple[int, ...]:
+    """
+    Precomputes F(0)..F(limit) so small inputs are answered by a plain lookup.
+    """
+    table = [0, 1]
+    for _ in range(limit - 1):
+        table.append(table[-1] + table[-2])
+
+    return tuple(table)
+
+
+_SMALL_FIB = _build_small_fib_table(_SMALL_FIB_LIMIT)
+
+
+def _fib_pair(n: int) -> Tuple[int, int]:
+    """
+    Computes the pair (F(n), F(n + 1)) using the fast doubling method.
+
+    Walks the bits of n from the most significant one, so only O(log n)
+    big-integer multiplications are needed instead of n additions.
+    """
+    a, b = 0, 1
+    for bit in bin(n)[2:]:
+        # F(2k) = F(k) * (2 * F(k + 1) - F(k))
+        # F(2k + 1) = F(k) ** 2 + F(k + 1) ** 2
+        c = a * (2 * b - a)
+        d = a * a + b * b
+        if bit == "1":
+            a, b = d, c + d
+        else:
+            a, b = c, d
+
+    return a, b
 
 
 def caching_fibonacci() -> Callable[[int], int]:
     """
     Returns a Fibonacci function that caches results to optimize performance.
 
+    Each call creates a new function with its own independent cache.
+
     Returns:
         Callable[[int], int]: A function that computes the nth Fibonacci number.
     """
-    cache = {}
 
+    @cache
     def fibonacci(n: int) -> int:
         if n < 0:
             raise ValueError("Input cannot be negative.")
 
-        if n <= 0:
-            return 0
-        if n == 1:
-            return 1
-
-        if n in cache:
-            return cache[n]
+        if n <= _SMALL_FIB_LIMIT:
+            return _SMALL_FIB[n]
 
-        result = fibonacci(n - 1) + fibonacci(n - 2)
+        return _fib_pair(n)[0]
 
-        cache[n] = result
+    return fibonacci
 
-        return result
 
-    return fibonacci
+# Shared instance, so its cache is reused by every module that imports it.
+# Call caching_fibonacci() to get a function with an isolated cache instead.
+fibonacci = caching_fibonacci()
@@ -1,5 +1,9 @@
+import re
 from typing import Generator, Callable
 
+# A real number standing as a separate, whitespace-delimited token
+_NUM_RE = re.compile(r'(?<!\S)[-+]?(?:\d+(?:\.\d*)?|\.\d+)(?:[eE][-+]?\d+)?(?!\S)')
+
 
 def generator_numbers(text: str) -> Generator[float, None, None]:
     """
@@ -12,15 +16,9 @@ def generator_numbers(text: str) -> Generator[float, None, None]:
     Yields:
         float: The found real number.
     """
-    for token in text.split():
-        try:
-            # Try to convert the token to a real number (float)
-            # If the conversion is successful, this is our income number
-            yield float(token)
-        except ValueError:
-            # If a ValueError occurs (the token is not a number, but a word,
-            # punctuation, etc.), simply ignore it and move to the next token.
-            continue
+    # Let the regex engine pick out the numeric tokens instead of trying
+    # float() on every word and paying for a ValueError on each miss
+    yield from map(float, _NUM_RE.findall(text))
 
 
 def sum_profit(text: str, func: Callable[[str], Generator[float, None, None]]) -> float:
@@ -35,4 +33,22 @@ def sum_profit(text: str, func: Callable[[str], Generator[float, None, None]]) -
     Returns:
         float: The total sum of the numbers.
     """
+    # The default generator only feeds the sum, so skip it and sum directly
+    if func is generator_numbers:
+        return sum_profit_fast(text)
+
     return sum(func(text))
+
+
+def sum_profit_fast(text: str) -> float:
+    """
+    Calculates the total sum of numbers (profit) in the input string
+    without going through the generator.
+
+    Args:
+        text (str): The input text string.
+
+    Returns:
+        float: The total sum of the numbers.
+    """
+    return sum(map(float, _NUM_RE.findall(text)))
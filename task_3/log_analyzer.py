@@ -1,49 +1,106 @@
+import re
 import sys
-from collections import defaultdict
+from collections import Counter
 import argparse
+from contextlib import contextmanager
+import os
+from multiprocessing import Pool
+from typing import Iterable, Iterator, NamedTuple
 
 LOG_LEVELS = ["INFO", "ERROR", "DEBUG", "WARNING"]
+# For membership checks; LOG_LEVELS keeps the display order
+LOG_LEVELS_SET = frozenset(LOG_LEVELS)
 
-def parse_log_line(line: str) -> dict | None:
+READ_CHUNK_SIZE = 1 << 16
+
+# Files at least this large are counted by several worker processes
+PARALLEL_MIN_FILE_SIZE = 16 << 20
+# Smallest part of the file worth handing to a separate worker process
+MIN_PART_SIZE = 4 << 20
+
+# Date, time, one of LOG_LEVELS and a non-empty message, separated by whitespace
+_LINE_RE = re.compile(
+    rf"^\s*(\S+)\s+(\S+)\s+({'|'.join(LOG_LEVELS)})\s+(\S.*?)\s*$",
+    re.IGNORECASE | re.ASCII
+)
+
+# Maps every level to the LOG_LEVELS literal itself, so all parsed records
+# share one string object per level and equality checks hit the identity fast path
+_LEVEL_INTERN = {level: level for level in LOG_LEVELS}
+
+# Position of each level in LOG_LEVELS, used to order the counts table
+_LEVEL_RANK = {level: rank for rank, level in enumerate(LOG_LEVELS)}
+
+
+class LogEntry(NamedTuple):
+    """
+    A single parsed log record.
+    """
+    date: str
+    time: str
+    level: str
+    message: str
+
+
+class BadLines:
+    """
+    Counts the lines of incorrect format and remembers the first of them.
     """
-    Parses a log line and returns a dictionary with its components.
+
+    def __init__(self) -> None:
+        """Starts with no lines recorded."""
+        self.count = 0
+        self.first: str | None = None
+
+    def add(self, line: str) -> None:
+        """Records a line of incorrect format."""
+        if self.first is None:
+            self.first = line
+        self.count += 1
+
+    def merge(self, other: "BadLines") -> None:
+        """Adds the stats of a later part, keeping the earlier first line; merge in file order."""
+        if self.first is None:
+            self.first = other.first
+        self.count += other.count
+
+
+def parse_log_line(line: str) -> LogEntry | None:
+    """
+    Parses a log line and returns a LogEntry with its components.
     Expected format: "Date Time LEVEL Message..."
     """
-    try:
-        parts = line.strip().split(' ', 3)
+    match = _LINE_RE.match(line)
 
-        if len(parts) < 4:
-            print(f"Incorrect format of line: {line.strip()}", file=sys.stderr)
-            return None
+    level = _LEVEL_INTERN.get(match[3].upper()) if match else None
+    if level is None:
+        return None
 
-        date, time, level, message = parts[0], parts[1], parts[2].upper(), parts[3]
+    return LogEntry(match[1], match[2], level, match[4])
 
-        if level not in LOG_LEVELS:
-            print(f"Unknown log level '{level}' in line: '{line.strip()}'", file=sys.stderr)
-            return None
 
-        return {
-            'date': date,
-            'time': time,
-            'level': level,
-            'message': message.strip()
-        }
-    except Exception as e:
-        print(f"Error parsing line: {line.strip()}. Error: {e}", file=sys.stderr)
+def _parse_file_line(line: str, bad_lines: BadLines | None) -> LogEntry | None:
+    """
+    Parses a line read from the log file, skipping blank lines.
+    Lines of incorrect format are recorded in bad_lines, if it is given.
+    """
+    if not line.strip():
         return None
 
+    parsed_log = parse_log_line(line)
+    if parsed_log is None and bad_lines is not None:
+        bad_lines.add(line.strip())
+
+    return parsed_log
 
-def load_logs(file_path: str) -> list[dict]:
+
+@contextmanager
+def _exit_on_read_error(file_path: str) -> Iterator[None]:
     """
-    Loads logs from a file at the specified path, applying parse_log_line to each line.
+    Reports an error raised while reading the log file and exits the script.
     """
-    logs = []
     try:
-        with open(file_path, 'r', encoding='utf-8') as file:
-            for line in file:
-                parsed_log = parse_log_line(line)
-                if parsed_log:
-                    logs.append(parsed_log)
+        yield
     except FileNotFoundError:
         print(f"Error: File not found at path '{file_path}'.", file=sys.stderr)
         sys.exit(1)
@@ -51,28 +108,164 @@ def load_logs(file_path: str) -> list[dict]:
         print(f"Unexpected error occurred while reading the file: {e}", file=sys.stderr)
         sys.exit(1)
 
-    return logs
 
+def _parse_lines(lines: Iterable[str], bad_lines: BadLines | None) -> Iterator[LogEntry]:
+    """
+    Parses lines read from the log file, yielding only the successfully parsed entries.
+    """
+    for line in lines:
+        parsed_log = _parse_file_line(line, bad_lines)
+        if parsed_log:
+            yield parsed_log
+
+
+def load_logs(file_path: str, bad_lines: BadLines | None = None) -> Iterator[LogEntry]:
+    """
+    Lazily loads logs from a file at the specified path, applying parse_log_line
+    to each line and yielding only the successfully parsed entries.
+    Lines of incorrect format are recorded in bad_lines, if it is given.
+    """
+    with _exit_on_read_error(file_path):
+        with open(file_path, 'r', encoding='utf-8') as file:
+            yield from _parse_lines(file, bad_lines)
 
-def filter_logs_by_level(logs: list[dict], level: str) -> list[dict]:
+
+def filter_logs_by_level(logs: list[LogEntry], level: str) -> list[LogEntry]:
     """
     Filters the list of logs by the specified log level.
     """
-    target_level = level.upper()
+    target_level = _LEVEL_INTERN.get(level.upper())
 
-    return list(filter(lambda log: log['level'] == target_level, logs))
+    return [log for log in logs if log.level == target_level]
 
 
-def count_logs_by_level(logs: list[dict]) -> dict[str, int]:
+def count_logs_by_level(logs: Iterable[LogEntry]) -> dict[str, int]:
     """
     Counts the number of log entries for each log level.
     """
-    counts = defaultdict(int)
-    for log in logs:
-        counts[log['level']] += 1
+    return dict(Counter(log.level for log in logs))
+
+
+def analyze(file_path: str,
+            level: str | None = None,
+            bad_lines: BadLines | None = None) -> tuple[dict[str, int], list[LogEntry]]:
+    """
+    Counts log entries for each level and collects the entries of the given
+    level in a single pass over the file, without keeping the other entries.
+    Lines of incorrect format are recorded in bad_lines, if it is given.
+    """
+    target_level = _LEVEL_INTERN.get(level.upper()) if level else None
+
+    counts = Counter()
+    filtered_logs = []
+    for log in load_logs(file_path, bad_lines):
+        counts[log.level] += 1
+        if log.level == target_level:
+            filtered_logs.append(log)
+
+    return dict(counts), filtered_logs
+
+
+def _read_file_part(file_path: str, start: int, end: int) -> Iterator[str]:
+    """
+    Reads the byte range [start, end) of the file in blocks of READ_CHUNK_SIZE
+    and yields its lines. Like text mode, accepts LF, CRLF and CR line endings.
+    """
+    with open(file_path, 'rb') as file:
+        file.seek(start)
+        remaining = end - start
+        # An incomplete last line of a block is carried over to the next one.
+        # A CRLF split between blocks only produces an extra blank line.
+        tail = b''
+        while remaining > 0 and (chunk := file.read(min(READ_CHUNK_SIZE, remaining))):
+            remaining -= len(chunk)
+            data = tail + chunk
+            lines = data.splitlines()
+            tail = b'' if data.endswith((b'\n', b'\r')) else lines.pop()
+            for raw_line in lines:
+                yield raw_line.decode('utf-8')
+
+        if tail:
+            yield tail.decode('utf-8')
+
+
+def _count_file_part(task: tuple[str, int, int]) -> tuple[Counter, BadLines]:
+    """
+    Counts log entries for each level in the byte range [start, end) of the file.
+    Runs in a worker process, so the lines of incorrect format are returned too.
+    """
+    counts = Counter()
+    bad_lines = BadLines()
+    for log in _parse_lines(_read_file_part(*task), bad_lines):
+        counts[log.level] += 1
+
+    return counts, bad_lines
+
+
+def _available_cpus() -> int:
+    """
+    Returns the number of CPUs this process is allowed to run on.
+    """
+    if hasattr(os, 'sched_getaffinity'):
+        return len(os.sched_getaffinity(0))
+
+    return os.cpu_count() or 1
+
+
+def _split_file(file_path: str, parts: int) -> list[tuple[str, int, int]]:
+    """
+    Splits the file into roughly equal byte ranges that start and end on line boundaries.
+    """
+    size = os.path.getsize(file_path)
+    bounds = [0]
+
+    with open(file_path, 'rb') as file:
+        for part in range(1, parts):
+            position = max(size * part // parts, bounds[-1])
+            if position >= size:
+                break
+            # Move the boundary to the beginning of the next line
+            file.seek(position)
+            file.readline()
+            bounds.append(file.tell())
+
+    bounds.append(size)
+
+    return [(file_path, start, end) for start, end in zip(bounds, bounds[1:]) if start < end]
+
+
+def count_logs_parallel(file_path: str,
+                        bad_lines: BadLines | None = None,
+                        workers: int | None = None) -> dict[str, int]:
+    """
+    Counts log entries for each level, parsing separate parts of the file
+    in a pool of worker processes and combining their results.
+    The number of workers is limited by the file size.
+    Lines of incorrect format are recorded in bad_lines, if it is given.
+    """
+    counts = Counter()
+
+    with _exit_on_read_error(file_path):
+        # No more workers than there are parts of at least MIN_PART_SIZE
+        workers = max(1, min(workers or _available_cpus(), os.path.getsize(file_path) // MIN_PART_SIZE))
+        with Pool(workers) as pool:
+            for part_counts, part_bad_lines in pool.map(_count_file_part, _split_file(file_path, workers)):
+                counts.update(part_counts)
+                if bad_lines is not None:
+                    bad_lines.merge(part_bad_lines)
+
     return dict(counts)
 
 
+def _use_parallel(file_path: str) -> bool:
+    """
+    Tells whether the file is large enough to be counted by several processes.
+    """
+    return (_available_cpus() > 1
+            and os.path.isfile(file_path)
+            and os.path.getsize(file_path) >= PARALLEL_MIN_FILE_SIZE)
+
+
 def display_log_counts(counts: dict[str, int]) -> None:
     """
     Formats and displays the log count results in a table.
@@ -86,22 +279,23 @@ def display_log_counts(counts: dict[str, int]) -> None:
     print(f"{header_level:<{max_level_len}} | {header_count}")
     print("-" * (max_level_len) + "-|" + "-" * len(header_count))
 
-    for level in sorted(counts.keys(), key=lambda x: LOG_LEVELS.index(x) if x in LOG_LEVELS else float('inf')):
+    for level in sorted(counts.keys(), key=lambda x: _LEVEL_RANK.get(x, len(LOG_LEVELS))):
         count = counts[level]
         print(f"{level:<{max_level_len}} | {count}")
 
 
-def display_filtered_logs(filtered_logs: list[dict], level: str) -> None:
+def display_filtered_logs(filtered_logs: list[LogEntry], level: str) -> None:
     """
     Prints detailed log entries for a specific level.
     """
     print(f"\nДеталі логів для рівня '{level.upper()}':")
     if filtered_logs:
-        for log in filtered_logs:
-            print(f"{log['date']} {log['time']} - {log['message']}")
+        # Build the whole block first and write it at once
+        sys.stdout.write("\n".join(f"{log.date} {log.time} - {log.message}" for log in filtered_logs) + "\n")
     else:
         print("Записів цього рівня не знайдено.")
 
+
 def main():
     """
     Main function to run the script. Handles command-line arguments.
@@ -119,21 +313,28 @@ def main():
 
     args = parser.parse_args()
 
-    all_logs = load_logs(args.log_file_path)
+    bad_lines = BadLines()
+    # Only the counts are needed without a level filter, so large files
+    # can be split between several processes
+    if not args.log_level and _use_parallel(args.log_file_path):
+        log_counts, filtered = count_logs_parallel(args.log_file_path, bad_lines), []
+    else:
+        log_counts, filtered = analyze(args.log_file_path, args.log_level, bad_lines)
+
+    # Report malformed lines once instead of writing to stderr for each of them
+    if bad_lines.count:
+        print(f"Skipped {bad_lines.count} line(s) of incorrect format, first: {bad_lines.first}", file=sys.stderr)
 
-    if not all_logs:
+    if not log_counts:
         print("No valid logs loaded from the file. Exit.")
         return
 
-    log_counts = count_logs_by_level(all_logs)
-
     display_log_counts(log_counts)
 
     if args.log_level:
         target_level = args.log_level.upper()
 
-        if target_level in LOG_LEVELS:
-            filtered = filter_logs_by_level(all_logs, target_level)
+        if target_level in LOG_LEVELS_SET:
             display_filtered_logs(filtered, target_level)
         else:
             print(f"Warning: Specified unknown log level '{args.log_level}'. Valid levels are: {', '.join(LOG_LEVELS)}")
@@ -1,7 +1,9 @@
-from typing import Tuple, List, Dict, Optional, Literal, Callable, Any
+import shlex
+from typing import Tuple, List, Dict, Callable, Any
 from functools import wraps
 
 Contacts = Dict[str, str]
+Handler = Callable[[List[str], Contacts], str]
 
 UNIVERSAL_ERROR_MESSAGE = "Enter the argument for the command"
 
@@ -27,60 +29,33 @@ def input_error(func: Callable[..., str]) -> Callable[..., str]:
 
 def parse_input(user_input: str) -> Tuple[str, List[str]]:
     """
-    Parses the user input string into a command and its arguments using a
-    state machine approach (cycle over the string).
+    Parses the user input string into a command and its arguments using the
+    standard shlex tokenizer.
     Supports multi-word arguments enclosed in double (") or single (') quotes.
     Nested quotes (e.g., 'text with "inner" quotes') are treated as literal text.
     The command is case-insensitive.
     """
 
-    args: List[str] = []
-
-    current_arg: str = ""
-    in_quotes: Optional[Literal] = None
-
-    # Pre-process the input by normalizing spaces and stripping leading/trailing whitespace
-    user_input = ' '.join(user_input.split())
-
-    if not user_input:
+    lexer = shlex.shlex(user_input, posix=True)
+    lexer.whitespace_split = True
+    # Keep '#' and backslashes as ordinary characters
+    lexer.commenters = ""
+    lexer.escape = ""
+
+    parts: List[str] = []
+    try:
+        for token in lexer:
+            parts.append(token)
+    except ValueError:
+        # Unclosed quotes: treat the rest of the input as the last argument
+        if lexer.token:
+            parts.append(lexer.token)
+
+    if not parts:
         return "", []
 
-    parts = user_input.split(maxsplit=1)
-    command = parts[0].strip().lower()
-
-    if len(parts) == 1:
-        return command, []
-
-    args_string = parts[1]
-
-    for char in args_string:
-        if in_quotes is not None:
-            if char == in_quotes:
-                in_quotes = None
-            else:
-                current_arg += char
-        else:
-            if char in ('"', "'"):
-                in_quotes = char
-            elif char == ' ':
-                if current_arg:
-                    args.append(current_arg)
-                current_arg = ""
-            else:
-                current_arg += char
-
-    if current_arg or (current_arg == "" and in_quotes is None and args_string.endswith(('"', "'")) and not args):
-        # Add the last collected argument, or handle case where input ends with an argument in quotes
-        args.append(current_arg)
-
-    # Check for unclosed quotes after processing
-    if in_quotes is not None:
-        # If quotes are unclosed, treat the whole remaining part as one argument
-        # For this simple bot, we'll just return the arguments collected so far,
-        # but in a real app, this would be an error.
-        pass
-
-    return command, args
+    # Empty quoted tokens ("" or '') are not valid arguments
+    return parts[0].lower(), [arg for arg in parts[1:] if arg]
 
 
 @input_error
@@ -141,6 +116,18 @@ def show_all(contacts: Contacts) -> str:
     return "\n".join(all_contacts)
 
 
+# Every handler takes the parsed arguments and the contacts dictionary
+COMMAND_HANDLERS: Dict[str, Handler] = {
+    "hello": lambda args, contacts: "How can I help you?",
+    "add": add_contact,
+    "change": change_contact,
+    "phone": show_phone,
+    "all": lambda args, contacts: show_all(contacts),
+}
+
+EXIT_COMMANDS = frozenset({"close", "exit"})
+
+
 def main() -> None:
     """
     The main function that manages the command processing loop.
@@ -162,22 +149,12 @@ def main() -> None:
 
         command, args = parse_input(user_input)
 
-        if command in ["close", "exit"]:
+        if command in EXIT_COMMANDS:
             print("Good bye!")
             break
 
-        elif command == "hello":
-            print("How can I help you?")
-        elif command == "add":
-            print(add_contact(args, contacts))
-        elif command == "change":
-            print(change_contact(args, contacts))
-        elif command == "phone":
-            print(show_phone(args, contacts))
-        elif command == "all":
-            print(show_all(contacts))
-        else:
-            print("Invalid command.")
+        handler = COMMAND_HANDLERS.get(command)
+        print(handler(args, contacts) if handler else "Invalid command.")
 
 
 if __name__ == "__main__":